@@ -0,0 +1,51 @@
+"""Compile yfs.summary and yfs.cleaner with Cython when building a wheel.
+
+The pure Python modules are always shipped as well and are used whenever Cython or a
+C compiler is not available, and always on PyPy.
+"""
+
+import platform
+
+from setuptools.command.build_ext import build_ext
+
+CYTHON_MODULES = ["yfs/summary.py", "yfs/cleaner.py"]
+
+# Type hints are not C types. pydantic passes ModelMetaclass where `type` is hinted.
+CYTHON_DIRECTIVES = {"annotation_typing": False}
+
+
+class OptionalBuildExt(build_ext):
+    """Fall back to the pure Python modules if an extension fails to compile."""
+
+    def run(self) -> None:
+        """Build all extensions, skipping them if the build can not run."""
+        try:
+            super().run()
+        except Exception as error:  # pylint: disable=broad-except
+            print(f"Skipping compiled extensions: {error}")
+
+    def build_extension(self, ext) -> None:  # noqa: ANN001
+        """Build one extension, skipping it if it fails to compile."""
+        try:
+            super().build_extension(ext)
+        except Exception as error:  # pylint: disable=broad-except
+            print(f"Skipping compiled extension {ext.name}: {error}")
+
+
+def build(setup_kwargs: dict) -> None:
+    """Add the Cython extensions to the setup arguments generated by poetry."""
+    # Extensions run through PyPy's cpyext layer, which is slower than the JIT on plain Python.
+    if platform.python_implementation() == "PyPy":
+        return
+
+    try:
+        from Cython.Build import cythonize  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        return
+
+    setup_kwargs.update(
+        ext_modules=cythonize(
+            CYTHON_MODULES, language_level=3, compiler_directives=CYTHON_DIRECTIVES
+        ),
+        cmdclass={"build_ext": OptionalBuildExt},
+    )
@@ -5,6 +5,7 @@ import pytest
 
 from yfs.paths import TEST_DIRECTORY
 
+from lxml.html import document_fromstring, HtmlElement
 from requests_html import HTML
 
 
@@ -15,6 +16,13 @@ def get_data(path: Path) -> HTML:
         return HTML(html=file.read())
 
 
+def get_tree(path: Path) -> HtmlElement:
+    assert path.exists()
+
+    with open(path, mode="r") as file:
+        return document_fromstring(file.read())
+
+
 @pytest.fixture(
     params=[
         "aapl",
@@ -34,7 +42,7 @@ def get_data(path: Path) -> HTML:
 def summary_page_data_fixture(request):
     symbol = request.param
     test_response_path = TEST_DIRECTORY / "data" / "summary" / f"{symbol}_summary_page_raw.html"
-    return symbol, get_data(test_response_path)
+    return symbol, get_tree(test_response_path)
 
 
 symbols = [
@@ -67,8 +75,8 @@ def multiple_summary_page_data_fixture(request):
     return (
         symbol_one,
         symbol_two,
-        get_data(test_response_path_one),
-        get_data(test_response_path_two),
+        get_tree(test_response_path_one),
+        get_tree(test_response_path_two),
         output,
     )
 
@@ -91,4 +99,4 @@ def option_page_data_fixture(request):
 def statistics_page_data_fixture(request):
     symbol = request.param
     test_response_path = TEST_DIRECTORY / "data" / f"{symbol}_statistics_page_raw.html"
-    return get_data(test_response_path)
+    return get_tree(test_response_path)
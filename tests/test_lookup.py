@@ -4,7 +4,7 @@ from pytest_regressions import data_regression  # noqa: F401
 
 from pydantic import ValidationError
 
-from yfs.lookup import ValidSymbol, ValidSymbolList
+from yfs.lookup import looks_like_ticker, ValidSymbol, ValidSymbolList
 from yfs.paths import TEST_DIRECTORY
 
 from yfs.exchanges import (
@@ -66,3 +66,19 @@ def test_raises_validation_error_with_invalid_exchange():
 def test_raises_validation_error_with_invalid_asset_type():
     with pytest.raises(ValidationError):
         ValidSymbol(symbol="aapl", name="Apple Inc.", exchange="NASDAQ", asset_type="FAKE_ASSET")
+
+
+@pytest.mark.parametrize(
+    "symbol,expected",
+    [
+        ("AAPL", True),
+        (" TSLA ", True),
+        ("BRK.B", True),
+        ("aapl", False),
+        ("Tesla", False),
+        ("GOOGLE", False),
+        ("apple inc", False),
+    ],
+)
+def test_looks_like_ticker(symbol, expected):
+    assert looks_like_ticker(symbol) is expected
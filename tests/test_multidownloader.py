@@ -0,0 +1,66 @@
+from types import SimpleNamespace
+
+import pytest
+
+import yfs.multidownloader
+from yfs.multidownloader import (
+    _download_pages_with_threads,
+    _download_pages_without_threads,
+    _unique_symbols,
+)
+
+
+def test_unique_symbols_keeps_first_spelling():
+    symbols = ["ford", " FORD", "aapl", "AAPL ", "Tesla", "", "  ", "TSLA"]
+    assert _unique_symbols(symbols) == ["ford", "aapl", "Tesla", "TSLA"]
+
+
+LOOKUPS = {"apple": "AAPL", "ford": "F", "tesla": "TSLA"}
+PAGES = {"AAPL", "F", "TSLA"}
+
+
+def fake_fuzzy_search(symbol, **kwargs):
+    if symbol.lower() in LOOKUPS:
+        return SimpleNamespace(symbol=LOOKUPS[symbol.lower()])
+    return None
+
+
+@pytest.fixture
+def fake_lookups(monkeypatch):
+    """Replace the symbol lookup of the downloaders with a fake."""
+    monkeypatch.setattr(yfs.multidownloader, "fuzzy_search", fake_fuzzy_search)
+
+
+@pytest.mark.parametrize("with_threads", [False, True])
+def test_download_pages_dedupes_lookups_against_tickers(fake_lookups, with_threads):
+    calls = []
+
+    def fake_callable(symbol, use_fuzzy_search, page_not_found_ok, **kwargs):
+        """Return a page like get_summary_page, falling back to a lookup if asked to."""
+        calls.append((symbol, use_fuzzy_search))
+
+        if symbol not in PAGES and use_fuzzy_search:
+            symbol = getattr(fake_fuzzy_search(symbol), "symbol", None)
+
+        if symbol in PAGES:
+            return SimpleNamespace(symbol=symbol)
+        return None
+
+    symbols = _unique_symbols(["AAPL", "apple", "ford", "TSLA", "TESLA", "unknown"])
+    arguments = dict(
+        group_object=list,
+        callable_=fake_callable,
+        symbols=symbols,
+        use_fuzzy_search=True,
+        page_not_found_ok=True,
+        progress_bar=False,
+        jitter=0,
+    )
+
+    if with_threads:
+        pages = _download_pages_with_threads(thread_count=4, **arguments)
+    else:
+        pages = _download_pages_without_threads(**arguments)
+
+    assert sorted(page.symbol for page in pages) == ["AAPL", "F", "TSLA"]
+    assert sorted(calls) == [("AAPL", True), ("F", False), ("TESLA", True), ("TSLA", True)]
@@ -1,23 +1,33 @@
+import json
+from types import SimpleNamespace
+
 import pytest
 from pytest_regressions import data_regression  # noqa: F401
 
-from collections import ChainMap
-
-from yfs.summary import parse_summary_table, SummaryPage, SummaryPageGroup
+from pandas import DataFrame
+from pydantic.json import pydantic_encoder
+
+from yfs.paths import TEST_DIRECTORY
+import yfs.summary
+from yfs.summary import (
+    create_summary_page,
+    get_summary_page,
+    parse_page_sections,
+    parse_summary_table,
+    SummaryPageGroup,
+)
 from yfs.quote import parse_quote_header_info
 
 from .common_fixtures import summary_page_data_fixture, multiple_summary_page_data_fixture
 
 
-def create_summary_page_object(symbol, data):
+def create_summary_page_object(symbol, data, strict=False):
     summary = parse_summary_table(data)
     quote = parse_quote_header_info(data)
 
-    data = ChainMap(quote.dict(), summary)
-    data["symbol"] = symbol
-    data["quote"] = quote
+    data = {**summary, **quote.__dict__, "symbol": symbol, "quote": quote}
 
-    return SummaryPage(**data)
+    return create_summary_page(data, strict=strict)
 
 
 def test_parse_summary_table(data_regression, summary_page_data_fixture):
@@ -31,6 +41,40 @@ def test_parse_summary_table(data_regression, summary_page_data_fixture):
     data_regression.check(result.json())
 
 
+def test_constructed_summary_page_matches_validated(summary_page_data_fixture):
+
+    symbol, data = summary_page_data_fixture
+
+    validated = create_summary_page_object(symbol, data, strict=True)
+    constructed = create_summary_page_object(symbol, data, strict=False)
+
+    assert constructed.dict() == validated.dict()
+    assert constructed.json() == validated.json()
+    assert {k: type(v) for k, v in constructed} == {k: type(v) for k, v in validated}
+
+
+@pytest.mark.parametrize("chunk_size", [1024, 16384])
+def test_parse_page_sections(summary_page_data_fixture, chunk_size):
+    symbol, data = summary_page_data_fixture
+
+    path = TEST_DIRECTORY / "data" / "summary" / f"{symbol}_summary_page_raw.html"
+    content = path.read_bytes()
+    chunks = [content[i : i + chunk_size] for i in range(0, len(content), chunk_size)]
+    consumed = []
+
+    def iter_content():
+        for chunk in chunks:
+            consumed.append(chunk)
+            yield chunk
+
+    html = parse_page_sections(iter_content(), ["quote-header-info", "quote-summary"])
+
+    assert parse_summary_table(html) == parse_summary_table(data)
+    assert parse_quote_header_info(html) == parse_quote_header_info(data)
+    assert len(consumed) == len(chunks)
+    assert len(html.xpath("//*")) < len(data.xpath("//*"))
+
+
 def test_sorting_summary_pages(multiple_summary_page_data_fixture):
     symbol_one, symbol_two, data_one, data_two, target = multiple_summary_page_data_fixture
     page_one = create_summary_page_object(symbol_one, data_one)
@@ -42,3 +86,128 @@ def test_sorting_summary_pages(multiple_summary_page_data_fixture):
     summary_page_group.append(page_two)
     summary_page_group.sort()
     assert summary_page_group.symbols == target
+
+
+def test_summary_page_group_dataframe(multiple_summary_page_data_fixture):
+    symbol_one, symbol_two, data_one, data_two, target = multiple_summary_page_data_fixture
+    page_one = create_summary_page_object(symbol_one, data_one)
+    page_two = create_summary_page_object(symbol_two, data_two)
+
+    summary_page_group = SummaryPageGroup()
+    assert summary_page_group.dataframe is None
+
+    summary_page_group.append(page_one)
+    assert summary_page_group.dataframe.index.tolist() == [page_one.symbol]
+
+    summary_page_group.append(page_two)
+    dataframe = summary_page_group.dataframe
+    assert dataframe.index.tolist() == target
+
+    expected = DataFrame.from_dict(summary_page_group.dict()["pages"])
+    expected = expected.drop("quote", axis=1).set_index("symbol").sort_index()
+    assert dataframe.equals(expected)
+
+
+def test_summary_page_group_dataframe_follows_pages(multiple_summary_page_data_fixture):
+    symbol_one, symbol_two, data_one, data_two, target = multiple_summary_page_data_fixture
+    page_one = create_summary_page_object(symbol_one, data_one)
+    page_two = create_summary_page_object(symbol_two, data_two)
+
+    summary_page_group = SummaryPageGroup()
+    summary_page_group.append(page_one)
+    assert summary_page_group.dataframe.index.tolist() == [page_one.symbol]
+
+    summary_page_group.pages = [page_two]
+    assert summary_page_group.dataframe.index.tolist() == [page_two.symbol]
+
+    summary_page_group.pages.append(page_one)
+    assert summary_page_group.dataframe.index.tolist() == target
+
+    summary_page_group.pages[0] = page_one
+    assert summary_page_group.dataframe.index.tolist() == [page_one.symbol] * 2
+
+    summary_page_group.pages.clear()
+    assert summary_page_group.dataframe is None
+
+
+def test_summary_page_group_json(multiple_summary_page_data_fixture):
+    symbol_one, symbol_two, data_one, data_two, target = multiple_summary_page_data_fixture
+    summary_page_group = SummaryPageGroup()
+    summary_page_group.append(create_summary_page_object(symbol_one, data_one))
+    summary_page_group.append(create_summary_page_object(symbol_two, data_two))
+
+    expected = json.dumps(summary_page_group.dict(), default=pydantic_encoder)
+    assert summary_page_group.json() == expected
+
+
+def test_summary_page_group_json_with_orjson(multiple_summary_page_data_fixture):
+    pytest.importorskip("orjson")
+    symbol_one, symbol_two, data_one, data_two, target = multiple_summary_page_data_fixture
+    summary_page_group = SummaryPageGroup()
+    summary_page_group.append(create_summary_page_object(symbol_one, data_one))
+    summary_page_group.append(create_summary_page_object(symbol_two, data_two))
+
+    result = summary_page_group.json(use_orjson=True)
+    assert json.loads(result) == json.loads(summary_page_group.json())
+
+    with pytest.raises(TypeError):
+        summary_page_group.json(use_orjson=True, indent=4)
+
+
+def test_summary_page_group_json_with_orjson_missing(monkeypatch):
+    monkeypatch.setattr(yfs.summary, "orjson", None)
+
+    with pytest.raises(ImportError):
+        SummaryPageGroup().json(use_orjson=True)
+
+
+def test_summary_page_is_immutable(summary_page_data_fixture):
+    symbol, data = summary_page_data_fixture
+    result = create_summary_page_object(symbol, data)
+
+    with pytest.raises(TypeError):
+        result.close = 0.0
+
+
+@pytest.fixture
+def fake_summary_requests(monkeypatch):
+    """Replace the page request and symbol lookup of get_summary_page with fakes."""
+    pages = {"AAPL": "AAPL page", "TSLA": "TSLA page", "F": "F page"}
+    lookups = {"TESLA": "TSLA", "ford": "F", "ZZZZ": "ZZZZ"}
+    calls = {"requested": [], "looked_up": []}
+
+    def fake_request_summary_page(symbol, **kwargs):
+        calls["requested"].append(symbol)
+        return pages.get(symbol)
+
+    def fake_fuzzy_search(symbol, **kwargs):
+        calls["looked_up"].append(symbol)
+        if symbol in lookups:
+            return SimpleNamespace(symbol=lookups[symbol])
+        return None
+
+    monkeypatch.setattr(yfs.summary, "_request_summary_page", fake_request_summary_page)
+    monkeypatch.setattr(yfs.summary, "fuzzy_search", fake_fuzzy_search)
+    return calls
+
+
+@pytest.mark.parametrize(
+    "symbol,page,requested,looked_up",
+    [
+        ("AAPL", "AAPL page", ["AAPL"], []),  # direct hit
+        ("TESLA", "TSLA page", ["TESLA", "TSLA"], ["TESLA"]),  # falls back to another symbol
+        ("ZZZZ", None, ["ZZZZ"], ["ZZZZ"]),  # falls back to the same symbol
+        ("ford", "F page", ["F"], ["ford"]),  # not a ticker, looked up first
+    ],
+)
+def test_get_summary_page_skips_fuzzy_search_for_tickers(
+    fake_summary_requests, symbol, page, requested, looked_up
+):
+    assert get_summary_page(symbol, page_not_found_ok=True) == page
+    assert fake_summary_requests["requested"] == requested
+    assert fake_summary_requests["looked_up"] == looked_up
+
+
+def test_get_summary_page_raises_after_fuzzy_fallback(fake_summary_requests):
+    with pytest.raises(AttributeError):
+        get_summary_page("ZZZZ")
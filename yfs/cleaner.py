@@ -3,10 +3,10 @@
 from functools import partial
 from typing import Dict, Optional, Union
 
+from lxml.html import HtmlElement
 import pendulum
 from pendulum import DateTime
 from pydantic import validator
-from requests_html import HTML
 
 
 numbers_with_suffix = {
@@ -16,6 +16,12 @@ numbers_with_suffix = {
     "K": 1_000,
 }
 
+missing_value_substrings = ("N/A", "undefined", "+-", "-+")
+"""* Values containing any of these strings are missing."""
+
+missing_value_strings = frozenset(("", " ", "-"))
+"""* Values equal to any of these strings are missing."""
+
 
 def field_cleaner(field: str) -> str:
     """Convert field string from an html response into a snake case variable.
@@ -59,17 +65,34 @@ def field_cleaner(field: str) -> str:
     )
 
 
-def table_cleaner(html_table: HTML) -> Optional[Dict]:
+def element_text(element: HtmlElement) -> str:
+    """Get the text of an element and its children with whitespace squashed.
+
+    Args:
+        element (HtmlElement): lxml element.
+
+    Example:
+        |Input                                  |Output          |
+        |---------------------------------------|----------------|
+        |<td> <span>Previous  Close</span> </td>|"Previous Close"|
+
+    Returns:
+        str: All text joined and separated by single spaces.
+    """
+    return " ".join("".join(element.itertext()).split())
+
+
+def table_cleaner(html_table: HtmlElement) -> Optional[Dict]:
     """Clean table with two fields.
 
     Args:
-        html_table (HTML): HTML object parsed from a table section.
+        html_table (HtmlElement): lxml element parsed from a table section.
 
     Returns:
         dict: cleaned fields (keys) and string (values).
         None: if html_table does not contain table elements.
     """
-    rows = [row.text.split("\n") for row in html_table.find("tr")]
+    rows = [[element_text(cell) for cell in row.iterfind("td")] for row in html_table.iter("tr")]
     rows = list(filter(lambda row: len(row) == 2, rows))
 
     data = {}
@@ -181,23 +204,13 @@ class CommonCleaners:
         if not isinstance(value, str):
             return False
 
-        missing_values = [
-            "N/A",
-            "undefined",
-            "+-",
-            "-+",
-        ]
+        if value in missing_value_strings:
+            return True
 
-        for missing in missing_values:
+        for missing in missing_value_substrings:
             if missing in value:
                 return True
 
-        other_missing = ["", " ", "-"]
-
-        for missing in other_missing:
-            if value == missing:
-                return True
-
         return False
 
     @staticmethod
@@ -216,11 +229,9 @@ class CommonCleaners:
         Returns:
             bool: True if string value contains T,B,M,K suffix else false.
         """
-        for suffix, _ in numbers_with_suffix.items():
-            if suffix in value.upper():
-                return True
+        value = value.upper()
 
-        return False
+        return any(suffix in value for suffix in numbers_with_suffix)
 
     @staticmethod
     def clean_large_number(value: str) -> Optional[int]:
@@ -236,9 +247,7 @@ class CommonCleaners:
 
         Returns:
             int: suffix removed and used as multiplier to convert to an int.
-            None: This can return None, but should not because the
-                has_large_number_suffix method should be used to check if
-                this method should even be run.
+            None: If value does not contain a T,B,M,K suffix.
         """
         value = value.upper()
 
@@ -270,8 +279,12 @@ class CommonCleaners:
         """
         value = cls.remove_comma(value)
 
-        if cls.has_large_number_suffix(value):
-            value = cls.clean_large_number(value)
+        # Uppercases and scans for a suffix once instead of checking first with
+        # has_large_number_suffix.
+        large_number = cls.clean_large_number(value)
+
+        if large_number is not None:
+            return large_number
 
         return value
 
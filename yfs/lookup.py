@@ -1,5 +1,6 @@
 """Contains the classes and functions for using the yahoo finance look up."""
 
+import re
 from typing import Iterable, List, Optional, Union
 
 from decouple import config
@@ -15,6 +16,28 @@ RAISE_ERROR_ON_UNKOWN_EXCHANGE_OR_ASSET = config(
     "RAISE_ERROR_ON_UNKOWN_EXCHANGE_OR_ASSET", default=False, cast=bool
 )
 
+TICKER_PATTERN = re.compile(r"^[A-Z]{1,5}(\.[A-Z]{1,3})?$")
+"""* Symbols matching this pattern are requested directly before falling back to a fuzzy search."""
+
+
+def looks_like_ticker(symbol: str) -> bool:
+    """Check if a symbol is already formatted like a ticker and can skip the fuzzy search.
+
+    Example:
+        |Input   |Output|
+        |--------|------|
+        |"AAPL"  |True  |
+        |"BRK.B" |True  |
+        |"aapl"  |False |
+        |"Tesla" |False |
+        |"GOOGLE"|False |
+
+    Returns:
+        bool: True if the stripped symbol is one to five uppercase letters with an
+            optional class suffix.
+    """
+    return TICKER_PATTERN.match(symbol.strip()) is not None
+
 
 class ExchangeNotFoundError(PydanticValueError):
     """Raised when an exchange is not found."""
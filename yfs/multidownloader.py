@@ -1,12 +1,40 @@
 """Download multiple pages with or without threads."""
 
-from concurrent.futures import as_completed, ThreadPoolExecutor
+from concurrent.futures import as_completed, Future, ThreadPoolExecutor
 from typing import Callable, List, Optional
 
 import enlighten
 from pydantic import BaseModel as Base
 
-from .lookup import fuzzy_search
+from .lookup import fuzzy_search, looks_like_ticker
+from .requestor import shared_session
+
+
+DEFAULT_THREADED_JITTER = 0.1
+"""* Max seconds each threaded request waits before it is sent."""
+
+
+def _unique_symbols(symbols: List[str]) -> List[str]:
+    """Strip and remove blank or duplicate symbols or company names.
+
+    Duplicates are matched regardless of case and the first spelling is kept, so
+    yfs.lookup.looks_like_ticker can still tell tickers from company names.
+
+    Example:
+        |Input                                 |Output                   |
+        |--------------------------------------|-------------------------|
+        |["aapl", "AAPL ", "Tesla", "", "TSLA"]|["aapl", "Tesla", "TSLA"]|
+
+    Returns:
+        list: Unique symbols in the order they were first given.
+    """
+    unique_symbols = {}
+
+    for symbol in symbols:
+        if symbol and symbol.strip():
+            unique_symbols.setdefault(symbol.strip().upper(), symbol.strip())
+
+    return list(unique_symbols.values())
 
 
 def _download_pages_without_threads(  # pylint: disable=too-many-arguments
@@ -19,57 +47,69 @@ def _download_pages_without_threads(  # pylint: disable=too-many-arguments
     **kwargs,  # noqa: ANN003
 ) -> Optional[Base]:
 
-    pages = group_object()
+    with shared_session(kwargs.pop("session", None), pool_size=1) as session:
+        pages = group_object()
+        tickers = set()
+
+        if use_fuzzy_search:
+            # Symbols already formatted like tickers skip the lookup here and are only
+            # looked up by callable_ if their page is not found.
+            tickers = {symbol for symbol in symbols if looks_like_ticker(symbol)}
+            lookups = [symbol for symbol in symbols if symbol not in tickers]
+            valid_symbols = []
+
+            if progress_bar:
+                pbar = enlighten.Counter(
+                    total=len(lookups), desc="Validating symbols...", unit="symbols"
+                )
+
+            for symbol in lookups:
+                result = fuzzy_search(
+                    symbol,
+                    first_ticker=True,
+                    session=session,
+                    **kwargs,  # proxies, timeout
+                )
+
+                valid_symbols.append(result)
 
-    if use_fuzzy_search:
-        valid_symbols = []
+                if progress_bar:
+                    pbar.update()
+
+            valid_symbols = filter(lambda s: s is not None, valid_symbols)
+            symbols = list(tickers.union(s.symbol for s in valid_symbols))
 
         if progress_bar:
             pbar = enlighten.Counter(
-                total=len(symbols), desc="Validating symbols...", unit="symbols"
+                total=len(symbols), desc="Downloading Page Data...", unit="symbols"
             )
 
+        # A ticker-like symbol can fall back to a symbol which is also being downloaded.
+        page_symbols = set()
+
         for symbol in symbols:
-            result = fuzzy_search(
+            results = callable_(
                 symbol,
-                first_ticker=True,
-                **kwargs,  # session, proxies, timeout
+                use_fuzzy_search=symbol in tickers,
+                page_not_found_ok=page_not_found_ok,
+                session=session,
+                **kwargs,  # proxies, timeout
             )
 
-            valid_symbols.append(result)
+            if results and results.symbol not in page_symbols:
+                page_symbols.add(results.symbol)
+                pages.append(results)
 
             if progress_bar:
                 pbar.update()
 
-        valid_symbols = filter(lambda s: s is not None, valid_symbols)
-        symbols = list(set(s.symbol for s in valid_symbols))
-
-    if progress_bar:
-        pbar = enlighten.Counter(
-            total=len(symbols), desc="Downloading Page Data...", unit="symbols"
-        )
-
-    for symbol in symbols:
-        results = callable_(
-            symbol,
-            use_fuzzy_search=False,
-            page_not_found_ok=page_not_found_ok,
-            **kwargs,  # session, proxies, timeout
-        )
-
-        if results:
-            pages.append(results)
-
-        if progress_bar:
-            pbar.update()
-
     if len(pages) > 0:
         return pages
 
     return None
 
 
-def _download_pages_with_threads(  # pylint: disable=too-many-arguments
+def _download_pages_with_threads(  # pylint: disable=too-many-arguments, too-many-locals
     group_object: Base,
     callable_: Callable,
     symbols: List[str],
@@ -81,61 +121,98 @@ def _download_pages_with_threads(  # pylint: disable=too-many-arguments
 ) -> Optional[Base]:
     pages = group_object()
 
-    if use_fuzzy_search:
-        valid_symbols = []
+    # Stagger the first burst of requests so the pool does not hit yahoo all at once.
+    kwargs.setdefault("jitter", DEFAULT_THREADED_JITTER)
 
+    # One pool and one keep-alive session sized to the pool are shared by both
+    # the symbol validation and the page download stages.
+    with shared_session(kwargs.pop("session", None), pool_size=thread_count) as session:
         with ThreadPoolExecutor(max_workers=thread_count) as executor:
-            futures = [
-                executor.submit(
-                    fuzzy_search,
+
+            def submit_download(symbol: str, use_fuzzy_search: bool = False) -> Future:
+                return executor.submit(
+                    callable_,
                     symbol,
-                    first_ticker=True,
+                    use_fuzzy_search=use_fuzzy_search,
+                    page_not_found_ok=page_not_found_ok,
+                    session=session,
                     **kwargs,
-                    # kwargs for requestor: session, proxies, timeout
+                    # kwargs for requestor: proxies, timeout
                 )
-                for symbol in symbols
-            ]
 
             if progress_bar:
-                pbar = enlighten.Counter(
-                    total=len(futures), desc="Validating symbols...", unit="symbols"
-                )
+                manager = enlighten.get_manager()
+
+            if use_fuzzy_search:
+                # Symbols already formatted like tickers skip the lookup here and are only
+                # looked up by callable_ if their page is not found.
+                valid_symbols = {symbol for symbol in symbols if looks_like_ticker(symbol)}
+                download_futures = [
+                    submit_download(symbol, use_fuzzy_search=True) for symbol in valid_symbols
+                ]
+
+                futures = [
+                    executor.submit(
+                        fuzzy_search,
+                        symbol,
+                        first_ticker=True,
+                        session=session,
+                        **kwargs,
+                        # kwargs for requestor: proxies, timeout
+                    )
+                    for symbol in symbols
+                    if symbol not in valid_symbols
+                ]
+
+                if progress_bar:
+                    validation_pbar = manager.counter(
+                        total=len(futures), desc="Validating symbols...", unit="symbols"
+                    )
+                    pbar = manager.counter(
+                        total=len(symbols), desc="Downloading Page Data...", unit="symbols"
+                    )
+
+                # Pages are downloaded as soon as their symbol is validated instead of
+                # waiting for every symbol lookup to finish.
+
+                for future in as_completed(futures):
+                    valid_symbol = future.result()
 
-            for future in as_completed(futures):
-                valid_symbols.append(future.result())
+                    if valid_symbol and valid_symbol.symbol not in valid_symbols:
+                        valid_symbols.add(valid_symbol.symbol)
+                        download_futures.append(submit_download(valid_symbol.symbol))
+
+                    if progress_bar:
+                        validation_pbar.update()
 
                 if progress_bar:
-                    pbar.update()
+                    pbar.total = len(download_futures)
 
-        valid_symbols = filter(lambda s: s is not None, valid_symbols)
-        symbols = list(set(s.symbol for s in valid_symbols))
+            else:
+                download_futures = [submit_download(symbol) for symbol in symbols]
 
-    with ThreadPoolExecutor(max_workers=thread_count) as executor:
-        futures = [
-            executor.submit(
-                callable_,
-                symbol,
-                use_fuzzy_search=False,
-                page_not_found_ok=page_not_found_ok,
-                **kwargs,
-                # kwargs for requestor: session, proxies, timeout
-            )
-            for symbol in symbols
-        ]
+                if progress_bar:
+                    pbar = manager.counter(
+                        total=len(download_futures),
+                        desc="Downloading Page Data...",
+                        unit="symbols",
+                    )
 
-        if progress_bar:
-            pbar = enlighten.Counter(
-                total=len(futures), desc="Downloading Page Data...", unit="symbols"
-            )
+            # A ticker-like symbol can fall back to a symbol which is also being downloaded.
+            page_symbols = set()
 
-        for future in as_completed(futures):
-            results = future.result()
+            for future in as_completed(download_futures):
+                results = future.result()
 
-            if results:
-                pages.append(results)
+                if results and results.symbol not in page_symbols:
+                    page_symbols.add(results.symbol)
+                    pages.append(results)
+
+                if progress_bar:
+                    pbar.update()
 
             if progress_bar:
-                pbar.update()
+                manager.stop()
 
     if len(pages) > 0:
         return pages
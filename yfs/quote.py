@@ -2,10 +2,26 @@
 
 from typing import Optional
 
+from lxml.cssselect import CSSSelector
+from lxml.etree import XPath
+from lxml.html import HtmlElement
 from pydantic import BaseModel as Base
-from requests_html import HTML
 
-from .cleaner import cleaner, CommonCleaners
+from .cleaner import cleaner, CommonCleaners, element_text
+
+
+QUOTE_HEADER_INFO = XPath("//div[@id='quote-header-info']")
+"""* Compiled selector for the quote header info section of a yahoo finance page."""
+
+QUOTE_SELECTORS = {
+    "name": CSSSelector(r".D\(ib\).Fz\(18px\)", translator="html"),
+    "close": CSSSelector(
+        r".Trsdu\(0\.3s\).Fw\(b\).Fz\(36px\).Mb\(-4px\).D\(ib\)", translator="html"
+    ),
+    "change": CSSSelector(r".Trsdu\(0\.3s\).Fw\(500\)", translator="html"),
+    "percent_change": CSSSelector(r".Trsdu\(0\.3s\).Fw\(500\)", translator="html"),
+}
+"""* Compiled selectors for each field in the quote header info section."""
 
 
 def clean_quote_name(value: str) -> str:
@@ -61,34 +77,27 @@ class Quote(Base):
     )
 
 
-def parse_quote_header_info(html: HTML) -> Optional[Quote]:
+def parse_quote_header_info(html: HtmlElement) -> Optional[Quote]:
     """Parse and clean html elements from the quote header info portion of a yahoo finance page.
 
     Args:
-        html (HTML): An HTML object containing quote header info data ready to be parse.
+        html (HtmlElement): lxml tree containing quote header info data ready to be parse.
 
     Returns:
         Quote: Quote object containing the parsed quote header data if successfully parsed.
         None: No quote header info data present in the HTML.
     """
-    quote_selectors = {
-        "name": r".D\(ib\).Fz\(18px\)",
-        "close": r".Trsdu\(0\.3s\).Fw\(b\).Fz\(36px\).Mb\(-4px\).D\(ib\)",
-        "change": r".Trsdu\(0\.3s\).Fw\(500\)",
-        "percent_change": r".Trsdu\(0\.3s\).Fw\(500\)",
-    }
-
-    quote_header_info = html.find("div#quote-header-info", first=True)
+    quote_header_info = QUOTE_HEADER_INFO(html)
 
     quote_data = {}
 
     if quote_header_info:
 
-        for field, selector in quote_selectors.items():
-            element = quote_header_info.find(selector)
+        for field, selector in QUOTE_SELECTORS.items():
+            element = selector(quote_header_info[0])
 
             if element and len(element) == 1:
-                quote_data[field] = element[0].text
+                quote_data[field] = element_text(element[0])
 
     if quote_data:
         return Quote(**quote_data)
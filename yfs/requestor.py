@@ -1,13 +1,72 @@
 """Send get requests."""
 
-from typing import Dict
+from contextlib import contextmanager
+import random
+import time
+from typing import Dict, Iterator, Optional
 
 import requests
 from requests import Response, Session
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+def create_session(pool_size: int = 10, retries: int = 2, backoff_factor: float = 0.2) -> Session:
+    """Create a Session which keeps connections alive and retries failed connections.
+
+    Args:
+        pool_size (int): Number of connections to keep open per host. Should match
+            the number of threads sharing the session.
+        retries (int): Total number of retries per request.
+        backoff_factor (float): Backoff factor applied between retries.
+
+    Returns:
+        Session: A session with a pooled HTTPAdapter mounted for http and https.
+    """
+    adapter = HTTPAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        max_retries=Retry(total=retries, backoff_factor=backoff_factor),
+    )
+
+    session = Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+    return session
+
+
+@contextmanager
+def shared_session(session: Optional[Session] = None, pool_size: int = 10) -> Iterator[Session]:
+    """Yield the session passed in or a new pooled session which is closed on exit.
+
+    Args:
+        session (Session): A session supplied by the caller. It is yielded as is and
+            never closed.
+        pool_size (int): Connection pool size used when a new session is created.
+
+    Yields:
+        Session: The session to send all requests with.
+    """
+    if session is not None:
+        yield session
+        return
+
+    session = create_session(pool_size=pool_size)
+
+    try:
+        yield session
+    finally:
+        session.close()
 
 
 def requestor(
-    url: str, session: Session = None, proxies: Dict[str, str] = None, timeout: int = 5
+    url: str,
+    session: Session = None,
+    proxies: Dict[str, str] = None,
+    timeout: int = 5,
+    jitter: float = 0,
+    stream: bool = False,
 ) -> Response:
     """Send get requests.
 
@@ -16,9 +75,15 @@ def requestor(
         session (Session): A Session object to send a request with.
         proxies (dict): Dictionary mapping protocol to the URL of the proxy.
         timeout (int): How long to wait for the server to send a response.
+        jitter (float): Wait a random number of seconds between 0 and jitter before
+            sending the request. Staggers bursts of threaded requests to the same host.
+        stream (bool): If True only the headers are downloaded until the body is read.
     """
-    # TODO: try and pass a session with retries plus whaor. pylint: disable=W0511
+    # TODO: try and pass a session with whaor. pylint: disable=W0511
+    if jitter:
+        time.sleep(random.uniform(0, jitter))
+
     if session:
-        return session.get(url, proxies=proxies, timeout=timeout)
+        return session.get(url, proxies=proxies, timeout=timeout, stream=stream)
 
-    return requests.get(url, proxies=proxies, timeout=timeout)
+    return requests.get(url, proxies=proxies, timeout=timeout, stream=stream)
@@ -2,19 +2,27 @@
 
 from collections import ChainMap
 from enum import Enum
+from io import StringIO
+from operator import attrgetter
 from typing import Iterable, List, Optional
 
+from lxml.cssselect import CSSSelector
+from lxml.etree import tostring
+from lxml.html import document_fromstring, HtmlElement
 import numpy as np
 import pandas
 from pandas import DataFrame
 from pendulum.date import Date
 from pydantic import BaseModel as Base
 from pydantic import Field
-from requests_html import HTML
 
-from .cleaner import cleaner, CommonCleaners, field_cleaner, table_cleaner
-from .lookup import fuzzy_search
-from .multidownloader import _download_pages_with_threads, _download_pages_without_threads
+from .cleaner import cleaner, CommonCleaners, element_text, field_cleaner, table_cleaner
+from .lookup import fuzzy_search, looks_like_ticker
+from .multidownloader import (
+    _download_pages_with_threads,
+    _download_pages_without_threads,
+    _unique_symbols,
+)
 from .quote import parse_quote_header_info, Quote
 from .requestor import requestor
 
@@ -358,8 +366,24 @@ class TradingInformation(Base):
     )(CommonCleaners.clean_date)
 
 
+_VALUATION_TABLE = CSSSelector(
+    r"table.W\(100\%\).Bdcl\(c\).M\(0\).Whs\(n\).D\(itb\)", translator="html"
+)
+"""* Compiled selector for the valuation measures table."""
+
+_FINANCIAL_HIGHLIGHTS_TABLE = CSSSelector(
+    r".Mb\(10px\).Pend\(20px\).smartphone_Pend\(0px\)", translator="html"
+)
+"""* Compiled selector for the financial highlights section."""
+
+_TRADING_INFORMATION_TABLE = CSSSelector(
+    r".Fl\(end\).W\(50\%\).smartphone_W\(100\%\)", translator="html"
+)
+"""* Compiled selector for the trading information section."""
+
+
 def parse_valuation_table(
-    html: HTML, period_type: PeriodType = PeriodType.QUARTERLY
+    html: HtmlElement, period_type: PeriodType = PeriodType.QUARTERLY
 ) -> Optional[ValuationMeasuresTable]:
     """Parse and clean fields and rows of a valuation measures table HTML element.
 
@@ -376,10 +400,11 @@ def parse_valuation_table(
         """Clean field of a valuation table with date."""
         return date_.replace("Current", "").replace("As of Date:", "").strip()
 
-    table_element = html.find(r"table.W\(100\%\).Bdcl\(c\).M\(0\).Whs\(n\).D\(itb\)", first=True)
+    table_element = _VALUATION_TABLE(html)
     if table_element:
 
-        table = pandas.read_html(table_element.html, index_col=0)
+        table_html = tostring(table_element[0], encoding="unicode")
+        table = pandas.read_html(StringIO(table_html), index_col=0)
         table = table[0].transpose()
         table = table.replace(np.nan, "N/A", regex=True)
 
@@ -402,25 +427,28 @@ def parse_valuation_table(
     return None
 
 
-def parse_financial_highlights_table(html: HTML) -> Optional[FinancialHighlights]:
+def parse_financial_highlights_table(html: HtmlElement) -> Optional[FinancialHighlights]:
     """Parse and clean fields and rows of a financial highlights section of an HTML element."""
-    table = html.find(r".Mb\(10px\).Pend\(20px\).smartphone_Pend\(0px\)", first=True)
+    table = _FINANCIAL_HIGHLIGHTS_TABLE(html)
 
     if table:
-        table_data = table_cleaner(table)
+        table_data = table_cleaner(table[0])
 
         return FinancialHighlights(**table_data)
 
     return None
 
 
-def parse_trading_information_table(html: HTML) -> Optional[TradingInformation]:
+def parse_trading_information_table(html: HtmlElement) -> Optional[TradingInformation]:
     """Parse and clean fields and rows of a trading information section of an HTML element."""
-    table_element = html.find(r".Fl\(end\).W\(50\%\).smartphone_W\(100\%\)", first=True)
+    table_element = _TRADING_INFORMATION_TABLE(html)
 
     if table_element:
 
-        rows = [row.text.split("\n") for row in table_element.find("tr")]
+        rows = [
+            [element_text(cell) for cell in row.iterfind("td")]
+            for row in table_element[0].iter("tr")
+        ]
         rows = list(filter(lambda row: len(row) == 2, rows))
 
         table_data = table_cleaner(html)
@@ -497,7 +525,7 @@ class StatisticsPageGroup(Base):
 
     """
 
-    pages: List[StatisticsPage] = list()
+    pages: List[StatisticsPage] = Field(default_factory=list)
 
     def append(self, page: StatisticsPage) -> None:
         """Append a StatisticsPage to the StatisticsPageGroup.
@@ -513,11 +541,11 @@ class StatisticsPageGroup(Base):
     @property
     def symbols(self: "StatisticsPageGroup") -> List[str]:
         """List of symbols in the StatisticsPageGroup."""
-        return [symbol.symbol for symbol in self]
+        return [page.symbol for page in self.pages]
 
     def sort(self: "StatisticsPageGroup") -> None:
         """Sort StatisticsPage objects by symbol."""
-        self.pages = sorted(self.pages)
+        self.pages.sort(key=attrgetter("symbol"))
 
     @property
     def dataframe(self: "StatisticsPageGroup") -> DataFrame:
@@ -546,6 +574,34 @@ class StatisticsPageGroup(Base):
         return len(self.pages)
 
 
+def _request_statistics_page(symbol: str, **kwargs) -> Optional[StatisticsPage]:  # noqa: ANN003
+    """Request and parse the statistics page of a symbol without validating it first."""
+    url = f"https://finance.yahoo.com/quote/{symbol}/key-statistics?p={symbol}"
+
+    response = requestor(url, **kwargs)
+
+    if response.ok:
+
+        html = document_fromstring(response.text)
+
+        quote = parse_quote_header_info(html)
+        valulation_measures = parse_valuation_table(html)
+        financial_highlights = parse_financial_highlights_table(html)
+        trading_information = parse_trading_information_table(html)
+
+        if quote and valulation_measures and financial_highlights and trading_information:
+
+            return StatisticsPage(
+                symbol=symbol,
+                quote=quote,
+                valuation_measures=valulation_measures,
+                financial_highlights=financial_highlights,
+                trading_information=trading_information,
+            )
+
+    return None
+
+
 def get_statistics_page(
     symbol: str,
     use_fuzzy_search: bool = True,
@@ -557,6 +613,8 @@ def get_statistics_page(
     Args:
         symbol (str): Ticker symbol.
         use_fuzzy_search (bool): If True validates symbol prior to requesting options page data.
+            Symbols already formatted like a ticker are requested directly and only looked
+            up if their page is not found.
         page_not_found_ok (bool): If True Returns None when page is not found.
         **kwargs: Pass (session, proxies, and timeout) to the requestor function.
 
@@ -567,34 +625,27 @@ def get_statistics_page(
     Raises:
         AttributeError: When a page is not found and the page_not_found_ok arg is false.
     """
+    requested_symbol = None
+
+    if use_fuzzy_search and looks_like_ticker(symbol):
+        requested_symbol = symbol = symbol.strip()
+        statistics_page = _request_statistics_page(symbol, **kwargs)
+
+        if statistics_page:
+            return statistics_page
+
     if use_fuzzy_search:
         fuzzy_response = fuzzy_search(symbol, first_ticker=True, **kwargs)
 
         if fuzzy_response:
             symbol = fuzzy_response.symbol
 
-    url = f"https://finance.yahoo.com/quote/{symbol}/key-statistics?p={symbol}"
+    if symbol != requested_symbol:
+        statistics_page = _request_statistics_page(symbol, **kwargs)
 
-    response = requestor(url)
+        if statistics_page:
+            return statistics_page
 
-    if response.ok:
-
-        html = HTML(html=response.text)
-
-        quote = parse_quote_header_info(html)
-        valulation_measures = parse_valuation_table(html)
-        financial_highlights = parse_financial_highlights_table(html)
-        trading_information = parse_trading_information_table(html)
-
-        if quote and valulation_measures and financial_highlights and trading_information:
-
-            return StatisticsPage(
-                symbol=symbol,
-                quote=quote,
-                valuation_measures=valulation_measures,
-                financial_highlights=financial_highlights,
-                trading_information=trading_information,
-            )
     if page_not_found_ok:
         return None
 
@@ -606,7 +657,7 @@ def get_multiple_statistics_pages(  # pylint: disable=too-many-arguments
     use_fuzzy_search: bool = True,
     page_not_found_ok: bool = True,
     with_threads: bool = False,
-    thread_count: int = 5,
+    thread_count: int = 32,
     progress_bar: bool = True,
     **kwargs,  # noqa: ANN003
 ) -> Optional[StatisticsPageGroup]:
@@ -615,11 +666,15 @@ def get_multiple_statistics_pages(  # pylint: disable=too-many-arguments
     Args:
         symbols (List[str]): Ticker symbols or company names.
         use_fuzzy_search (bool): If True does a symbol lookup validation prior
-            to requesting data.
+            to requesting data. Uppercase symbols formatted like a ticker are requested
+            directly and only looked up if their page is not found.
         page_not_found_ok (bool): If True Returns None when page is not found.
         with_threads (bool): If True uses threading.
         thread_count (int): Number of threads to use if with_threads is set to True.
-        **kwargs: Pass (session, proxies, and timeout) to the requestor function.
+            Downloading is IO bound so throughput keeps scaling well past the cpu count.
+            Between 50 and 100 threads is fast while still being polite to yahoo.
+        **kwargs: Pass (session, proxies, timeout, and jitter) to the requestor function.
+            When with_threads is True jitter defaults to 0.1 seconds.
         progress_bar (bool): If True shows the progress bar else the progress bar
             is not shown.
 
@@ -630,7 +685,7 @@ def get_multiple_statistics_pages(  # pylint: disable=too-many-arguments
     Raises:
         AttributeError: When a page is not found and the page_not_found_ok arg is false.
     """
-    symbols = list(set(symbols))
+    symbols = _unique_symbols(symbols)
     group_object = StatisticsPageGroup
     callable_ = get_statistics_page
 